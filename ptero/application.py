@@ -3,95 +3,321 @@ Ptero-Wrapper Application
 Contains the ApplicationAPI class for interacting with the Pterodactyl Application API.
 """
 
-import httpx, logging
-from typing import Optional, List, Dict, Any
+import httpx, asyncio, logging, time
+from copy import deepcopy
+from functools import partial
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable, AsyncIterator
 from .models import User, Node, Location, Nest, Egg, NodeAllocation
+from .utils import loads, auth_headers, failed_response, POOL_LIMITS, gather_bounded, encode_json_body
 
 logger = logging.getLogger("ptero.application")
 
+# Most pages of one listing fetched at once; the panel rate-limits the Application API
+# and a failed page cuts the listing short, so large listings must not flood it
+_PAGE_CONCURRENCY = 8
+
+# Most failure responses a disabled ApplicationAPI keeps around for reuse
+_DISABLED_RESPONSES_MAX = 128
+
+# Relationships that are always requested for servers and nodes
+_SERVER_INCLUDES = "node,user"
+_NODE_INCLUDES = "allocations,location"
+
+def _merge_includes(base_csv: str, extra_csv: Optional[str]) -> str:
+    """Merges a caller-supplied 'include' value into a base one, dropping duplicates but keeping order."""
+    if not extra_csv:
+        return base_csv
+    return ','.join(dict.fromkeys(inc for inc in (base_csv + ',' + extra_csv).split(',') if inc))
+
 class ApplicationAPI:
     def __init__(self, 
                  app_session: httpx.AsyncClient, 
                  base_url: str,
-                 panel_id: str):
+                 panel_id: str,
+                 cache_ttl: float = 60.0):
         
         self.app_session = app_session
         self.base_url = base_url
         self.panel_id = panel_id
         self.enabled = app_session is not None
-
-    async def _paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[dict]:
-        """Helper to automatically paginate through 'list' endpoints."""
-        if params is None:
-            params = {}
+        self._app_prefix = f"{base_url}/application/"
+        # Failure responses returned while the API is disabled, built once per (method, endpoint)
+        self._disabled_responses: Dict[Tuple[str, str], httpx.Response] = {}
+        
+        # TTL cache for rarely-changing lookups (nests, eggs, locations, node configs)
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[tuple, Tuple[float, Any]] = {} # Key: (endpoint, params), Value: (expires_at, data)
+        self._cache_loads: Dict[tuple, 'asyncio.Future[Any]'] = {} # Loads in flight, shared by concurrent misses
+        self._cache_generation = 0 # Bumped by clear_cache so loads started before it don't store stale data
+        
+        # GET requests currently in flight, shared by identical concurrent callers
+        self._inflight: Dict[tuple, 'asyncio.Future[httpx.Response]'] = {}
+
+    @classmethod
+    def create(cls, base_url: str, app_key: str, panel_id: str, **client_kwargs) -> 'ApplicationAPI':
+        """
+        Builds a standalone ApplicationAPI that owns a pooled HTTP/2 session.
+
+        Create it once at application startup and reuse it for the lifetime of the
+        event loop. Extra keyword arguments are passed on to httpx.AsyncClient.
+        """
+        headers = auth_headers(app_key)
+        client_kwargs.setdefault('limits', POOL_LIMITS)
+        client_kwargs.setdefault('http2', True)
+        client_kwargs.setdefault('timeout', 30.0)
+        app_session = httpx.AsyncClient(headers=headers, **client_kwargs)
+        return cls(app_session, base_url.rstrip('/'), panel_id)
+
+    async def aclose(self):
+        """Closes the underlying httpx session, if there is one."""
+        if self.app_session:
+            await self.app_session.aclose()
+
+    async def __aenter__(self) -> 'ApplicationAPI':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None, mode: str = "page") -> List[dict]:
+        """
+        Helper to automatically paginate through 'list' endpoints.
+
+        In "page" mode the first page is fetched on its own to learn 'total_pages',
+        then all remaining pages are requested concurrently over the session's pool.
+        In "cursor" mode the 'meta.pagination.links.next' link of each response is
+        followed until the panel stops returning one.
+        """
+        # Work on a private copy: page numbers must not leak into the caller's dict
+        params = dict(params) if params else {}
         
         if not self.app_session:
-            logger.warning(f"Attempted to paginate {endpoint} on panel {self.panel_id} but session is not enabled.")
+            logger.warning("Attempted to paginate %s on panel %s but session is not enabled.", endpoint, self.panel_id)
             return []
 
-        full_url = f"{self.base_url}/application/{endpoint}"
+        # Larger pages mean fewer round-trips and JSON decodes
+        params.setdefault('per_page', 100)
+        if mode == "cursor":
+            return [item async for item in self._iter_paginate(endpoint, params)]
         
-        all_data: List[dict] = []
-        page = 1
-        params['page'] = page
+        params['page'] = 1
         
-        try:
-            while True:
-                params['page'] = page
-                resp = await self.app_session.get(full_url, params=params)
-                
-                if resp.status_code != 200:
-                    logger.error(f"Failed to paginate {endpoint} on panel {self.panel_id} page {page}: {resp.status_code} {resp.text}")
-                    break
-                    
-                data = resp.json()
-                all_data.extend(data['data'])
-                
-                if data['meta']['pagination']['current_page'] >= data['meta']['pagination']['total_pages']:
-                    break
-                page += 1
-                
-        except httpx.RequestError as e:
-            logger.error(f"HTTP error during pagination for {endpoint} on panel {self.panel_id}: {e}")
+        resp = await self._app_request("GET", endpoint, params=params)
+        if resp.status_code != 200:
+            # resp.text decodes the whole body, so only touch it if the record will be emitted
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Failed to paginate %s on panel %s page 1: %d %s", endpoint, self.panel_id, resp.status_code, resp.text)
+            return []
+
+        data = loads(resp.content)
+        # The decoded first page is a fresh list, so it is returned (or extended) as-is
+        all_data: List[dict] = data.get('data', [])
+        total_pages = data.get('meta', {}).get('pagination', {}).get('total_pages', 1)
+        if total_pages <= 1:
+            return all_data
+
+        # Every task gets its own params dict so the pages don't alias each other
+        tasks = (self._app_request("GET", endpoint, params={**params, 'page': page}) for page in range(2, total_pages + 1))
+        responses = await gather_bounded(tasks, _PAGE_CONCURRENCY)
+
+        # Stop at the first failed page so the result stays a contiguous prefix
+        for page, resp in enumerate(responses, start=2):
+            if resp.status_code != 200:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error("Failed to paginate %s on panel %s page %d: %d %s", endpoint, self.panel_id, page, resp.status_code, resp.text)
+                break
+            all_data.extend(loads(resp.content)['data'])
         
         return all_data
 
+    async def _iter_paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[dict]:
+        """
+        Yields the items of a 'list' endpoint one page at a time.
+
+        The next page is only requested once the current one has been consumed, so
+        breaking out of the loop early skips the remaining pages entirely. Pages are
+        chained through 'meta.pagination.links.next', falling back to 'current_page'.
+        """
+        params = dict(params) if params else {}
+        
+        if not self.app_session:
+            logger.warning("Attempted to paginate %s on panel %s but session is not enabled.", endpoint, self.panel_id)
+            return
+
+        params.setdefault('per_page', 100)
+        
+        while True:
+            resp = await self._app_request("GET", endpoint, params=params)
+            
+            if resp.status_code != 200:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error("Failed to paginate %s on panel %s (%s): %d %s", endpoint, self.panel_id, resp.url, resp.status_code, resp.text)
+                return
+                
+            data = loads(resp.content)
+            for item in data.get('data', []):
+                yield item
+            
+            # Fractal serializes an empty 'links' object as [], so only trust a dict
+            pagination = data.get('meta', {}).get('pagination', {})
+            links = pagination.get('links')
+            next_link = links.get('next') if isinstance(links, dict) else None
+            
+            if next_link:
+                # httpx replaces a URL's query string with `params`, so fold the link's
+                # query (page or cursor token) into params for the next request
+                params = {**params, **dict(httpx.URL(next_link).params)}
+            else:
+                current_page = pagination.get('current_page', 1)
+                if current_page >= pagination.get('total_pages', 1):
+                    return
+                params = {**params, 'page': current_page + 1}
+
 
     # -----------------------------------------------------------------
     # Application API Helper
     # -----------------------------------------------------------------
 
     async def _app_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
-        """Helper to make a request to the Application API."""
-        if not self.app_session:
-            logger.error(f"Application API request failed for {endpoint} on panel {self.panel_id}: API is not configured.")
-            return httpx.Response(status_code=500, request=httpx.Request(method, f"{self.base_url}/application/{endpoint}"), text="Application API not configured")
-
-        full_url = f"{self.base_url}/application/{endpoint}"
+        """
+        Helper to make a request to the Application API.
+
+        Identical GET requests that are already in flight are coalesced: later
+        callers await the first request and receive the same response.
+        """
+        full_url = self._app_prefix + endpoint
+        if not self.enabled:
+            logger.error("Application API request failed for %s on panel %s: API is not configured.", endpoint, self.panel_id)
+            return self._disabled_response(method, endpoint, full_url)
+        
+        if method != "GET":
+            # Any write may change what the cached lookups and coalesced GETs return. Both are detached
+            # again once it's done, so reads started while the write was in flight don't outlive it.
+            self._forget_reads()
+            try:
+                return await self._send(method, endpoint, full_url, **encode_json_body(kwargs))
+            finally:
+                self._forget_reads()
+        
+        if kwargs.keys() - {'params'}:
+            # Custom headers, timeouts etc. make the request unique
+            return await self._send(method, endpoint, full_url, **kwargs)
         
+        key = self._cache_key(endpoint, kwargs.get('params'))
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._send(method, endpoint, full_url, **kwargs))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(partial(self._discard, self._inflight, key))
+        
+        # Shielded so one cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(inflight)
+
+    def _disabled_response(self, method: str, endpoint: str, full_url: str) -> httpx.Response:
+        """Returns the shared failure response for a request on the disabled API, with its real method and URL."""
+        key = (method, endpoint)
+        resp = self._disabled_responses.get(key)
+        if resp is None:
+            if len(self._disabled_responses) >= _DISABLED_RESPONSES_MAX:
+                self._disabled_responses.clear() # Endpoints embed ids, so keep the table bounded
+            resp = self._disabled_responses[key] = failed_response(method, full_url, "Application API not configured")
+        return resp
+
+    def _forget_reads(self):
+        """Makes later reads miss everything fetched before now; callers already waiting keep their own futures."""
+        self._inflight.clear()
+        self.clear_cache()
+
+    async def _send(self, method: str, endpoint: str, full_url: str, **kwargs) -> httpx.Response:
+        """Sends a single request, turning transport errors into a 500 response."""
         try:
             return await self.app_session.request(method, full_url, **kwargs)
         except httpx.RequestError as e:
-            logger.error(f"Application API request failed for {endpoint} on panel {self.panel_id}: {e}")
-            return httpx.Response(status_code=500, request=httpx.Request(method, full_url), text=str(e))
+            logger.error("Application API request failed for %s on panel %s: %s", endpoint, self.panel_id, e)
+            return failed_response(method, full_url, str(e))
+    
+    async def _get_json(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[dict]:
+        """Helper to GET an endpoint and return its parsed body, or None on a non-200 response."""
+        resp = await self._app_request("GET", endpoint, params=params)
+        return loads(resp.content) if resp.status_code == 200 else None
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> tuple:
+        """Builds a hashable cache key, normalizing the order of the query params."""
+        return (endpoint, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+
+    async def _cached_get(self, key: tuple, loader: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        """
+        Returns the result of `loader`, reusing it for `ttl` seconds (defaults to cache_ttl).
+
+        Concurrent misses on the same key share a single load, so only one of them
+        hits the panel. Empty or failed results are not cached. Every caller gets its
+        own copy, so mutating a result (or a model built from it) can't corrupt the cache.
+        """
+        ttl = self.cache_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return await loader()
+
+        entry = self._get_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return deepcopy(entry[1])
+
+        load = self._cache_loads.get(key)
+        if load is None:
+            load = asyncio.ensure_future(self._load_cache_entry(key, loader, ttl))
+            self._cache_loads[key] = load
+            load.add_done_callback(partial(self._discard, self._cache_loads, key))
+        
+        # Shielded so one cancelled caller doesn't cancel the load for everyone else
+        return deepcopy(await asyncio.shield(load))
+
+    async def _load_cache_entry(self, key: tuple, loader: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        generation = self._cache_generation
+        value = await loader()
+        # Skipped when the cache was cleared meanwhile: the value may predate a write
+        if value and generation == self._cache_generation:
+            self._get_cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def clear_cache(self):
+        """Drops every cached nest, egg, location and node configuration lookup."""
+        self._get_cache.clear()
+        # Loads already running keep serving their own waiters, but later lookups start fresh ones
+        self._cache_loads.clear()
+        self._cache_generation += 1
+
+    @staticmethod
+    def _discard(table: Dict[tuple, asyncio.Future], key: tuple, future: asyncio.Future):
+        """Done-callback removing `future` from `table`, unless it has been replaced by a newer one meanwhile."""
+        if table.get(key) is future:
+            del table[key]
     
     # -----------------------------------------------------------------
     # Application API - Users
     # -----------------------------------------------------------------
 
-    async def get_users(self, params: Optional[Dict[str, Any]] = None) -> List[User]:
+    async def get_users(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> List[User]:
         """Gets a paginated list of all users."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'servers'
+        params.setdefault('per_page', per_page)
         all_users_data = await self._paginate("users", params=params)
-        return [User(user_data, api=self, panel_id=self.panel_id) for user_data in all_users_data]
+        return list(map(partial(User, api=self, panel_id=self.panel_id), all_users_data))
+
+    async def iter_users(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> AsyncIterator[User]:
+        """Yields all users page by page, without building the full list first."""
+        params = dict(params) if params else {}
+        params['include'] = 'servers'
+        params.setdefault('per_page', per_page)
+        async for user_data in self._iter_paginate("users", params=params):
+            yield User(user_data, api=self, panel_id=self.panel_id)
 
     async def get_user(self, user_id: int, params: Optional[Dict[str, Any]] = None) -> Optional[User]:
         """Gets details for a specific user."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'servers'
         resp = await self._app_request("GET", f"users/{user_id}", params=params)
-        return User(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        return User(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
 
     async def create_user(self, email: str, username: str, first_name: str, last_name: str, **kwargs) -> Optional[User]:
         """Creates a new user."""
@@ -101,12 +327,12 @@ class ApplicationAPI:
             **kwargs # Pass extra params like 'password', 'root_admin'
         }
         resp = await self._app_request("POST", "users", json=payload)
-        return User(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 201 else None
+        return User(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 201 else None
 
     async def update_user(self, user_id: int, **kwargs) -> Optional[User]:
         """Updates a user's details."""
         resp = await self._app_request("PATCH", f"users/{user_id}", json=kwargs)
-        return User(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        return User(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
 
     async def delete_user(self, user_id: int) -> bool:
         """Deletes a user."""
@@ -117,48 +343,51 @@ class ApplicationAPI:
     # Application API - Servers
     # -----------------------------------------------------------------
 
-    async def get_servers(self, params: Optional[Dict[str, Any]] = None) -> List[dict]:
+    async def get_servers(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> List[dict]:
         """Gets a paginated list of all servers (returns raw dicts)."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         # Ensure relationships are included
-        base_includes = ['user', 'node']
-        existing_includes = params.get('include', '').split(',')
-        all_includes = list(set(base_includes + [inc for inc in existing_includes if inc]))
-        params['include'] = ','.join(all_includes)
+        params['include'] = _merge_includes(_SERVER_INCLUDES, params.get('include'))
+        params.setdefault('per_page', per_page)
         
         return await self._paginate("servers", params=params)
 
+    async def iter_servers(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> AsyncIterator[dict]:
+        """Yields all servers (raw dicts) page by page, without building the full list first."""
+        params = dict(params) if params else {}
+        params['include'] = _merge_includes(_SERVER_INCLUDES, params.get('include'))
+        params.setdefault('per_page', per_page)
+        async for server_data in self._iter_paginate("servers", params=params):
+            yield server_data
+
     async def get_server_details(self, server_id: int, params: Optional[Dict[str, Any]] = None) -> Optional[dict]:
         """Gets details for a specific server (returns raw dict)."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         # Ensure relationships are included
-        base_includes = ['user', 'node']
-        existing_includes = params.get('include', '').split(',')
-        all_includes = list(set(base_includes + [inc for inc in existing_includes if inc]))
-        params['include'] = ','.join(all_includes)
+        params['include'] = _merge_includes(_SERVER_INCLUDES, params.get('include'))
         
         resp = await self._app_request("GET", f"servers/{server_id}", params=params)
-        return resp.json() if resp.status_code == 200 else None
+        return loads(resp.content) if resp.status_code == 200 else None
 
     async def create_server(self, data: Dict[str, Any]) -> Optional[dict]:
         """Creates a new server."""
         resp = await self._app_request("POST", "servers", json=data)
-        return resp.json() if resp.status_code == 201 else None
+        return loads(resp.content) if resp.status_code == 201 else None
 
     async def update_server_details(self, server_id: int, **kwargs) -> Optional[dict]:
         """Updates a server's basic details (name, user, external_id, description)."""
         resp = await self._app_request("PATCH", f"servers/{server_id}/details", json=kwargs)
-        return resp.json() if resp.status_code == 200 else None
+        return loads(resp.content) if resp.status_code == 200 else None
 
     async def update_server_build(self, server_id: int, **kwargs) -> Optional[dict]:
         """Updates a server's build configuration (limits, allocations)."""
         resp = await self._app_request("PATCH", f"servers/{server_id}/build", json=kwargs)
-        return resp.json() if resp.status_code == 200 else None
+        return loads(resp.content) if resp.status_code == 200 else None
 
     async def update_server_startup(self, server_id: int, **kwargs) -> Optional[dict]:
         """Updates a server's startup parameters."""
         resp = await self._app_request("PATCH", f"servers/{server_id}/startup", json=kwargs)
-        return resp.json() if resp.status_code == 200 else None
+        return loads(resp.content) if resp.status_code == 200 else None
 
     async def suspend_server(self, server_id: int) -> bool:
         resp = await self._app_request("POST", f"servers/{server_id}/suspend")
@@ -183,48 +412,74 @@ class ApplicationAPI:
         resp = await self._app_request("DELETE", endpoint)
         return resp.status_code == 204
 
+    # Bulk variants: run the single-server call for every ID, with at most
+    # `concurrency` requests in flight so a sweep doesn't flood the panel.
+
+    async def suspend_servers(self, server_ids: List[int], concurrency: int = 20) -> List[bool]:
+        """Suspends several servers concurrently. Results are in the same order as `server_ids`."""
+        return await gather_bounded((self.suspend_server(server_id) for server_id in server_ids), concurrency)
+
+    async def unsuspend_servers(self, server_ids: List[int], concurrency: int = 20) -> List[bool]:
+        """Unsuspends several servers concurrently. Results are in the same order as `server_ids`."""
+        return await gather_bounded((self.unsuspend_server(server_id) for server_id in server_ids), concurrency)
+
+    async def rebuild_servers(self, server_ids: List[int], concurrency: int = 20) -> List[bool]:
+        """Rebuilds several servers concurrently. Results are in the same order as `server_ids`."""
+        return await gather_bounded((self.rebuild_server(server_id) for server_id in server_ids), concurrency)
+
+    async def reinstall_servers(self, server_ids: List[int], concurrency: int = 20) -> List[bool]:
+        """Reinstalls several servers concurrently. Results are in the same order as `server_ids`."""
+        return await gather_bounded((self.reinstall_server(server_id) for server_id in server_ids), concurrency)
+
+    async def delete_servers(self, server_ids: List[int], force: bool = False, concurrency: int = 20) -> List[bool]:
+        """Deletes several servers concurrently. Results are in the same order as `server_ids`."""
+        return await gather_bounded((self.delete_server(server_id, force=force) for server_id in server_ids), concurrency)
+
     # -----------------------------------------------------------------
     # Application API - Nodes
     # -----------------------------------------------------------------
 
-    async def get_nodes(self, params: Optional[Dict[str, Any]] = None) -> List[Node]:
+    async def get_nodes(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> List[Node]:
         """Gets a paginated list of all nodes."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         # Ensure relationships are included
-        base_includes = ['location', 'allocations']
-        existing_includes = params.get('include', '').split(',')
-        all_includes = list(set(base_includes + [inc for inc in existing_includes if inc]))
-        params['include'] = ','.join(all_includes)
+        params['include'] = _merge_includes(_NODE_INCLUDES, params.get('include'))
+        params.setdefault('per_page', per_page)
         
         all_nodes_data = await self._paginate("nodes", params=params)
-        return [Node(node_data, api=self, panel_id=self.panel_id) for node_data in all_nodes_data]
+        return list(map(partial(Node, api=self, panel_id=self.panel_id), all_nodes_data))
+
+    async def iter_nodes(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> AsyncIterator[Node]:
+        """Yields all nodes page by page, without building the full list first."""
+        params = dict(params) if params else {}
+        params['include'] = _merge_includes(_NODE_INCLUDES, params.get('include'))
+        params.setdefault('per_page', per_page)
+        async for node_data in self._iter_paginate("nodes", params=params):
+            yield Node(node_data, api=self, panel_id=self.panel_id)
 
     async def get_node(self, node_id: int, params: Optional[Dict[str, Any]] = None) -> Optional[Node]:
         """Gets details for a specific node."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         # Ensure relationships are included
-        base_includes = ['location', 'allocations']
-        existing_includes = params.get('include', '').split(',')
-        all_includes = list(set(base_includes + [inc for inc in existing_includes if inc]))
-        params['include'] = ','.join(all_includes)
+        params['include'] = _merge_includes(_NODE_INCLUDES, params.get('include'))
         
         resp = await self._app_request("GET", f"nodes/{node_id}", params=params)
-        return Node(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        return Node(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
     
     async def get_node_config(self, node_id: int) -> Optional[dict]:
         """Gets the configuration for a specific node."""
-        resp = await self._app_request("GET", f"nodes/{node_id}/configuration")
-        return resp.json() if resp.status_code == 200 else None
+        endpoint = f"nodes/{node_id}/configuration"
+        return await self._cached_get(self._cache_key(endpoint), lambda: self._get_json(endpoint))
 
     async def create_node(self, **kwargs) -> Optional[Node]:
         """Creates a new node."""
         resp = await self._app_request("POST", "nodes", json=kwargs)
-        return Node(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 201 else None
+        return Node(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 201 else None
 
     async def update_node(self, node_id: int, **kwargs) -> Optional[Node]:
         """Updates a node's details."""
         resp = await self._app_request("PATCH", f"nodes/{node_id}", json=kwargs)
-        return Node(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        return Node(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
 
     async def delete_node(self, node_id: int) -> bool:
         """Deletes a node."""
@@ -235,10 +490,17 @@ class ApplicationAPI:
     # Application API - Node Allocations
     # -----------------------------------------------------------------
 
-    async def get_node_allocations(self, node_id: int, params: Optional[Dict[str, Any]] = None) -> List[NodeAllocation]:
+    async def get_node_allocations(self, node_id: int, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> List[NodeAllocation]:
         """Gets a paginated list of all allocations for a node."""
+        params = dict(params) if params else {}
+        params.setdefault('per_page', per_page)
         all_allocs_data = await self._paginate(f"nodes/{node_id}/allocations", params=params)
-        return [NodeAllocation(alloc_data) for alloc_data in all_allocs_data]
+        return list(map(NodeAllocation, all_allocs_data))
+
+    async def get_all_node_allocations(self, node_ids: List[int], params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> Dict[int, List[NodeAllocation]]:
+        """Gets the allocations of several nodes concurrently, keyed by node ID."""
+        results = await asyncio.gather(*(self.get_node_allocations(node_id, params=params, per_page=per_page) for node_id in node_ids))
+        return dict(zip(node_ids, results))
 
     async def create_allocation(self, node_id: int, ip: str, ports: List[str], **kwargs) -> bool:
         """Creates new allocations on a node."""
@@ -255,51 +517,58 @@ class ApplicationAPI:
     # Application API - Nests & Eggs
     # -----------------------------------------------------------------
 
-    async def get_nests(self, params: Optional[Dict[str, Any]] = None) -> List[Nest]:
+    async def get_nests(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> List[Nest]:
         """Gets a paginated list of all nests."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'eggs'
-        all_nests_data = await self._paginate("nests", params=params)
-        return [Nest(nest_data, api=self, panel_id=self.panel_id) for nest_data in all_nests_data]
+        params.setdefault('per_page', per_page)
+        all_nests_data = await self._cached_get(self._cache_key("nests", params), lambda: self._paginate("nests", params=params))
+        return list(map(partial(Nest, api=self, panel_id=self.panel_id), all_nests_data))
 
     async def get_nest(self, nest_id: int, params: Optional[Dict[str, Any]] = None) -> Optional[Nest]:
         """Gets details for a specific nest."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'eggs'
-        resp = await self._app_request("GET", f"nests/{nest_id}", params=params)
-        return Nest(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        endpoint = f"nests/{nest_id}"
+        nest_data = await self._cached_get(self._cache_key(endpoint, params), lambda: self._get_json(endpoint, params))
+        return Nest(nest_data, api=self, panel_id=self.panel_id) if nest_data else None
         
-    async def get_eggs_in_nest(self, nest_id: int, params: Optional[Dict[str, Any]] = None) -> List[Egg]:
+    async def get_eggs_in_nest(self, nest_id: int, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> List[Egg]:
         """Gets a paginated list of all eggs in a nest."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'nest'
-        all_eggs_data = await self._paginate(f"nests/{nest_id}/eggs", params=params)
-        return [Egg(egg_data, api=self, panel_id=self.panel_id) for egg_data in all_eggs_data]
+        params.setdefault('per_page', per_page)
+        endpoint = f"nests/{nest_id}/eggs"
+        all_eggs_data = await self._cached_get(self._cache_key(endpoint, params), lambda: self._paginate(endpoint, params=params))
+        return list(map(partial(Egg, api=self, panel_id=self.panel_id), all_eggs_data))
 
     async def get_egg(self, nest_id: int, egg_id: int, params: Optional[Dict[str, Any]] = None) -> Optional[Egg]:
         """Gets details for a specific egg."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'nest'
-        resp = await self._app_request("GET", f"nests/{nest_id}/eggs/{egg_id}", params=params)
-        return Egg(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        endpoint = f"nests/{nest_id}/eggs/{egg_id}"
+        egg_data = await self._cached_get(self._cache_key(endpoint, params), lambda: self._get_json(endpoint, params))
+        return Egg(egg_data, api=self, panel_id=self.panel_id) if egg_data else None
 
     # -----------------------------------------------------------------
     # Application API - Locations
     # -----------------------------------------------------------------
     
-    async def get_locations(self, params: Optional[Dict[str, Any]] = None) -> List[Location]:
+    async def get_locations(self, params: Optional[Dict[str, Any]] = None, per_page: int = 100) -> List[Location]:
         """Gets a paginated list of all locations."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'nodes'
-        all_locs_data = await self._paginate("locations", params=params)
-        return [Location(loc_data, api=self, panel_id=self.panel_id) for loc_data in all_locs_data]
+        params.setdefault('per_page', per_page)
+        all_locs_data = await self._cached_get(self._cache_key("locations", params), lambda: self._paginate("locations", params=params))
+        return list(map(partial(Location, api=self, panel_id=self.panel_id), all_locs_data))
 
     async def get_location(self, location_id: int, params: Optional[Dict[str, Any]] = None) -> Optional[Location]:
         """Gets details for a specific location."""
-        if params is None: params = {}
+        params = dict(params) if params else {}
         params['include'] = 'nodes'
-        resp = await self._app_request("GET", f"locations/{location_id}", params=params)
-        return Location(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        endpoint = f"locations/{location_id}"
+        loc_data = await self._cached_get(self._cache_key(endpoint, params), lambda: self._get_json(endpoint, params))
+        return Location(loc_data, api=self, panel_id=self.panel_id) if loc_data else None
     
     async def create_location(self, short_code: str, description: str) -> Optional[Location]:
         """Creates a new location."""
@@ -308,12 +577,12 @@ class ApplicationAPI:
             "long": description
         }
         resp = await self._app_request("POST", "locations", json=payload)
-        return Location(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 201 else None
+        return Location(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 201 else None
 
     async def update_location(self, location_id: int, **kwargs) -> Optional[Location]:
         """Updates a location."""
         resp = await self._app_request("PATCH", f"locations/{location_id}", json=kwargs)
-        return Location(resp.json(), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
+        return Location(loads(resp.content), api=self, panel_id=self.panel_id) if resp.status_code == 200 else None
 
     async def delete_location(self, location_id: int) -> bool:
         """Deletes a location."""
@@ -9,6 +9,7 @@ from .models import (
     EggVariable, Allocation, SftpDetails, Limits, FeatureLimits, Resource,
     Backup, Database, FileStat, Schedule, Task, Subuser, Node, User
 )
+from .utils import failed_response, loads, encode_json_body
 
 if TYPE_CHECKING:
     from .application import ApplicationAPI
@@ -82,12 +83,19 @@ class ClientServer:
             logger.warning(f"Client API disabled for panel {self.panel_id}, skipping async setup for server {self.identifier}")
             return
             
-        if not self.is_installing:
-            try:
-                self.resources = await self.get_resources()
-            except Exception as e:
-                logger.warning(f"Failed to get resources for {self.identifier} during setup: {e}")
-        
+        # The resources and websocket requests are independent, so they run concurrently
+        tasks = [self._setup_websocket()]
+        if not self.is_installing and self.resources is None:
+            tasks.append(self._setup_resources())
+        await asyncio.gather(*tasks)
+
+    async def _setup_resources(self):
+        try:
+            self.resources = await self.get_resources()
+        except Exception as e:
+            logger.warning(f"Failed to get resources for {self.identifier} during setup: {e}")
+
+    async def _setup_websocket(self):
         try:
             ws_data = await self.get_websocket()
             if ws_data:
@@ -125,17 +133,16 @@ class ClientServer:
 
     async def _client_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
         """Helper to make a request to the correct panel."""
+        full_url = f"{self.base_url}/client/servers/{self.identifier}/{endpoint}"
         if not self.session:
             logger.error(f"Client API request failed for {self.identifier} on panel {self.panel_id}: Client is not enabled (missing API key).")
-            return httpx.Response(status_code=500, request=httpx.Request(method, f"{self.base_url}/client/servers/{self.identifier}/{endpoint}"), text="Client API not configured")
-
-        full_url = f"{self.base_url}/client/servers/{self.identifier}/{endpoint}"
+            return failed_response(method, full_url, "Client API not configured")
         
         try:
-            return await self.session.request(method, full_url, **kwargs)
+            return await self.session.request(method, full_url, **encode_json_body(kwargs))
         except httpx.RequestError as e:
             logger.error(f"HTTP request failed for server {self.identifier} on panel {self.panel_id}: {e}")
-            return httpx.Response(status_code=500, request=httpx.Request(method, full_url), text=str(e))
+            return failed_response(method, full_url, str(e))
 
     # -----------------------------------------------------------------
     # App API Lazy Loaders
@@ -183,7 +190,7 @@ class ClientServer:
         """Gets the current resource usage for the server."""
         response = await self._client_request("GET", "resources")
         if response.status_code == 200:
-            self.resources = Resource(response.json())
+            self.resources = Resource(loads(response.content))
             return self.resources
         elif response.status_code == 404:
             logger.warning(f"Server {self.identifier} not found on panel {self.panel_id} while getting resources.")
@@ -196,7 +203,7 @@ class ClientServer:
         response = await self._client_request("GET", "websocket")
         if response.status_code == 200:
             self.ws_resp = response
-            return response.json()["data"]
+            return loads(response.content)["data"]
         self.ws_resp = response
         logger.error(f"Failed to get websocket for {self.identifier} on panel {self.panel_id}: {response.status_code} {response.text}")
         return None
@@ -253,7 +260,7 @@ class ClientServer:
             await self.refresh_websocket()
             if not self.ws_url or not self.ws_token:
                 logger.error(f"Failed to refresh websocket for {self.identifier}. Cannot send command with output.")
-                return (httpx.Response(500, request=httpx.Request("POST", "command"), text="WebSocket details unavailable"), "ws_fail")
+                return (failed_response("POST", "command", "WebSocket details unavailable"), "ws_fail")
 
         try:
             async with websockets.connect(self.ws_url, additional_headers=headers, open_timeout=timeout) as ws:
@@ -265,21 +272,21 @@ class ClientServer:
                 auth_success = False
                 try:
                     async for message_raw in ws:
-                        message = json.loads(message_raw)
+                        message = loads(message_raw)
                         if message["event"] == "auth success":
                             auth_success = True
                             break
                         if message["event"] == "jwt error":
                             logger.warning(f"JWT error for {self.identifier} on panel {self.panel_id}, refreshing token and retrying.")
                             await self.refresh_websocket()
-                            return (httpx.Response(401, request=httpx.Request("POST", "command"), text="JWT Error"), "ws_fail:jwt")
+                            return (failed_response("POST", "command", "JWT Error", status_code=401), "ws_fail:jwt")
                 except websockets.exceptions.ConnectionClosed:
                     logger.error(f"Websocket closed prematurely during auth for {self.identifier} on panel {self.panel_id}")
-                    return (httpx.Response(500, request=httpx.Request("POST", "command"), text="WebSocket closed during auth"), "ws_fail:auth_closed")
+                    return (failed_response("POST", "command", "WebSocket closed during auth"), "ws_fail:auth_closed")
 
                 if not auth_success:
                     logger.error(f"Websocket auth failed for {self.identifier} on panel {self.panel_id}")
-                    return (httpx.Response(401, request=httpx.Request("POST", "command"), text="WebSocket auth failed"), "ws_fail:auth")
+                    return (failed_response("POST", "command", "WebSocket auth failed", status_code=401), "ws_fail:auth")
 
                 while True:
                     try:
@@ -296,7 +303,7 @@ class ClientServer:
                 try:
                     while True:
                         message_raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
-                        data = json.loads(message_raw)
+                        data = loads(message_raw)
                         if data["event"] == "console output":
                             raw = data["args"][0]
                             stripped = ANSI_ESCAPE.sub('', raw).strip()
@@ -315,12 +322,12 @@ class ClientServer:
             if e.status_code == 401 or e.status_code == 403:
                 logger.info(f"Refreshing websocket due to {e.status_code}...")
                 await self.refresh_websocket()
-            return (httpx.Response(e.status_code, request=httpx.Request("POST", "command"), text=str(e)), "ws_fail:connect")
+            return (failed_response("POST", "command", str(e), status_code=e.status_code), "ws_fail:connect")
         except Exception as e:
             logger.error(f"Generic websocket failure for {self.identifier} on panel {self.panel_id}: {e}")
-            return (httpx.Response(500, request=httpx.Request("POST", "command"), text=str(e)), "ws_fail:generic")
+            return (failed_response("POST", "command", str(e)), "ws_fail:generic")
 
-        return (httpx.Response(500, request=httpx.Request("POST", "command"), text="No output captured"), "ws_no_output")
+        return (failed_response("POST", "command", "No output captured"), "ws_no_output")
 
     # -----------------------------------------------------------------
     # Backups API
@@ -329,7 +336,7 @@ class ClientServer:
     async def list_backups(self) -> List[Backup]:
         resp = await self._client_request("GET", "backups")
         if resp.status_code == 200:
-            return [Backup(b) for b in resp.json()["data"]]
+            return [Backup(b) for b in loads(resp.content)["data"]]
         return []
 
     async def create_backup(self, name: Optional[str] = None, ignored_files: Optional[List[str]] = None, is_locked: bool = False) -> Optional[Backup]:
@@ -338,20 +345,20 @@ class ClientServer:
         
         resp = await self._client_request("POST", "backups", json=payload)
         if resp.status_code == 200:
-            return Backup(resp.json())
+            return Backup(loads(resp.content))
         logger.error(f"Failed to create backup for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
     async def get_backup_details(self, backup_uuid: str) -> Optional[Backup]:
         resp = await self._client_request("GET", f"backups/{backup_uuid}")
         if resp.status_code == 200:
-            return Backup(resp.json())
+            return Backup(loads(resp.content))
         return None
 
     async def get_backup_download(self, backup_uuid: str) -> Optional[str]:
         resp = await self._client_request("POST", f"backups/{backup_uuid}/download")
         if resp.status_code == 200:
-            return resp.json()["attributes"]["url"]
+            return loads(resp.content)["attributes"]["url"]
         logger.error(f"Failed to get backup download for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
@@ -371,14 +378,14 @@ class ClientServer:
     async def list_databases(self) -> List[Database]:
         resp = await self._client_request("GET", "databases")
         if resp.status_code == 200:
-            return [Database(db) for db in resp.json()["data"]]
+            return [Database(db) for db in loads(resp.content)["data"]]
         return []
 
     async def create_database(self, database_name: str, remote: str = "%") -> Optional[Database]:
         payload = {"database": database_name, "remote": remote}
         resp = await self._client_request("POST", "databases", json=payload)
         if resp.status_code == 200:
-            return Database(resp.json())
+            return Database(loads(resp.content))
         logger.error(f"Failed to create database for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
@@ -395,7 +402,7 @@ class ClientServer:
     async def list_files(self, directory: str = "/") -> List[FileStat]:
         resp = await self._client_request("GET", "files/list", params={"directory": directory})
         if resp.status_code == 200:
-            return [FileStat(f) for f in resp.json()["data"]]
+            return [FileStat(f) for f in loads(resp.content)["data"]]
         return []
 
     async def get_file_contents(self, file_path: str) -> Optional[str]:
@@ -407,7 +414,7 @@ class ClientServer:
     async def get_file_download(self, file_path: str) -> Optional[str]:
         resp = await self._client_request("POST", "files/download", json={"file": file_path})
         if resp.status_code == 200:
-            return resp.json()["attributes"]["url"]
+            return loads(resp.content)["attributes"]["url"]
         return None
 
     async def rename_file(self, root: str, from_name: str, to_name: str) -> httpx.Response:
@@ -421,10 +428,9 @@ class ClientServer:
         headers = self.client_headers.copy()
         headers["Content-Type"] = "text/plain"
         
-        if not self.session:
-            return httpx.Response(status_code=500, request=httpx.Request("POST", f"{self.base_url}/client/servers/{self.identifier}/files/write"), text="Client API not configured")
-
         full_url = f"{self.base_url}/client/servers/{self.identifier}/files/write"
+        if not self.session:
+            return failed_response("POST", full_url, "Client API not configured")
         
         return await self.session.post(full_url, params={"file": file_path}, content=content, headers=headers)
 
@@ -432,7 +438,7 @@ class ClientServer:
         payload = {"root": root, "files": files}
         resp = await self._client_request("POST", "files/compress", json=payload)
         if resp.status_code == 200:
-            return FileStat(resp.json())
+            return FileStat(loads(resp.content))
         return None
 
     async def decompress_file(self, root: str, file: str) -> httpx.Response:
@@ -450,7 +456,7 @@ class ClientServer:
     async def get_upload_url(self) -> Optional[str]:
         resp = await self._client_request("GET", "files/upload")
         if resp.status_code == 200:
-            return resp.json()["attributes"]["url"]
+            return loads(resp.content)["attributes"]["url"]
         return None
 
     # -----------------------------------------------------------------
@@ -460,14 +466,14 @@ class ClientServer:
     async def list_allocations(self) -> List[Allocation]:
         resp = await self._client_request("GET", "network/allocations")
         if resp.status_code == 200:
-            self.allocations = [Allocation(alloc["attributes"]) for alloc in resp.json()["data"]]
+            self.allocations = [Allocation(alloc["attributes"]) for alloc in loads(resp.content)["data"]]
             return self.allocations
         return []
 
     async def set_primary_allocation(self, allocation_id: int) -> Optional[Allocation]:
         resp = await self._client_request("POST", f"network/allocations/{allocation_id}/primary")
         if resp.status_code == 200:
-            return Allocation(resp.json()["attributes"])
+            return Allocation(loads(resp.content)["attributes"])
         return None
 
     async def unassign_allocation(self, allocation_id: int) -> httpx.Response:
@@ -480,7 +486,7 @@ class ClientServer:
     async def list_schedules(self) -> List[Schedule]:
         resp = await self._client_request("GET", "schedules")
         if resp.status_code == 200:
-            return [Schedule(s) for s in resp.json()["data"]]
+            return [Schedule(s) for s in loads(resp.content)["data"]]
         return []
 
     async def create_schedule(self, name: str, cron_minute: str, cron_hour: str, cron_day_of_month: str, cron_month: str, cron_day_of_week: str, is_active: bool = True, only_when_online: bool = False) -> Optional[Schedule]:
@@ -491,14 +497,14 @@ class ClientServer:
         }
         resp = await self._client_request("POST", "schedules", json=payload)
         if resp.status_code == 200:
-            return Schedule(resp.json())
+            return Schedule(loads(resp.content))
         logger.error(f"Failed to create schedule for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
     async def get_schedule(self, schedule_id: int) -> Optional[Schedule]:
         resp = await self._client_request("GET", f"schedules/{schedule_id}")
         if resp.status_code == 200:
-            return Schedule(resp.json())
+            return Schedule(loads(resp.content))
         return None
 
     async def update_schedule(self, schedule_id: int, **kwargs) -> Optional[Schedule]:
@@ -513,7 +519,7 @@ class ClientServer:
         
         resp = await self._client_request("POST", f"schedules/{schedule_id}", json=payload)
         if resp.status_code == 200:
-            return Schedule(resp.json())
+            return Schedule(loads(resp.content))
         logger.error(f"Failed to update schedule {schedule_id} for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
@@ -524,7 +530,7 @@ class ClientServer:
         payload_json = {"action": action, "payload": payload, "time_offset": time_offset}
         resp = await self._client_request("POST", f"schedules/{schedule_id}/tasks", json=payload_json)
         if resp.status_code == 200:
-            return Task(resp.json()["attributes"])
+            return Task(loads(resp.content)["attributes"])
         logger.error(f"Failed to create task for schedule {schedule_id} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
@@ -532,7 +538,7 @@ class ClientServer:
         payload_json = {"action": action, "payload": payload, "time_offset": time_offset}
         resp = await self._client_request("POST", f"schedules/{schedule_id}/tasks/{task_id}", json=payload_json)
         if resp.status_code == 200:
-            return Task(resp.json()["attributes"])
+            return Task(loads(resp.content)["attributes"])
         logger.error(f"Failed to update task {task_id} for schedule {schedule_id} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
         
@@ -562,7 +568,7 @@ class ClientServer:
     async def get_startup_vars(self) -> List[EggVariable]:
         resp = await self._client_request("GET", "startup")
         if resp.status_code == 200:
-            self.egg_variables = [EggVariable(var["attributes"]) for var in resp.json()["data"]]
+            self.egg_variables = [EggVariable(var["attributes"]) for var in loads(resp.content)["data"]]
             return self.egg_variables
         return []
 
@@ -570,7 +576,7 @@ class ClientServer:
         payload = {"key": key, "value": str(value)}
         resp = await self._client_request("PUT", "startup/variable", json=payload)
         if resp.status_code == 200:
-            return EggVariable(resp.json()["attributes"])
+            return EggVariable(loads(resp.content)["attributes"])
         logger.error(f"Failed to update startup var {key} for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
@@ -581,28 +587,28 @@ class ClientServer:
     async def list_subusers(self) -> List[Subuser]:
         resp = await self._client_request("GET", "users")
         if resp.status_code == 200:
-            return [Subuser(u) for u in resp.json()["data"]]
+            return [Subuser(u) for u in loads(resp.content)["data"]]
         return []
 
     async def create_subuser(self, email: str, permissions: List[str]) -> Optional[Subuser]:
         payload = {"email": email, "permissions": permissions}
         resp = await self._client_request("POST", "users", json=payload)
         if resp.status_code == 200:
-            return Subuser(resp.json())
+            return Subuser(loads(resp.content))
         logger.error(f"Failed to create subuser for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
     async def get_subuser(self, user_uuid: str) -> Optional[Subuser]:
         resp = await self._client_request("GET", f"users/{user_uuid}")
         if resp.status_code == 200:
-            return Subuser(resp.json())
+            return Subuser(loads(resp.content))
         return None
 
     async def update_subuser(self, user_uuid: str, permissions: List[str]) -> Optional[Subuser]:
         payload = {"permissions": permissions}
         resp = await self._client_request("POST", f"users/{user_uuid}", json=payload)
         if resp.status_code == 200:
-            return Subuser(resp.json())
+            return Subuser(loads(resp.content))
         logger.error(f"Failed to update subuser {user_uuid} for {self.identifier} on panel {self.panel_id}: {resp.status_code} {resp.text}")
         return None
 
@@ -3,14 +3,24 @@ Ptero-Wrapper Control
 Contains the main PteroControl class, the entry point for the wrapper.
 """
 
-import httpx, asyncio, logging
-from typing import Optional, List, Dict, Any, Tuple, Union
+import httpx, asyncio, logging, time
+from typing import Optional, List, Dict, Any, Tuple, Union, Awaitable, TypeVar
 from .client import ClientServer
 from .application import ApplicationAPI
 from .models import Node, User, Panel
+from .utils import loads, auth_headers, failed_response, POOL_LIMITS, limit_concurrency, run_all
 
 logger = logging.getLogger("ptero.control")
 
+T = TypeVar("T")
+
+# Most servers hydrated at once by get_servers (each one costs a resources and a websocket request)
+_HYDRATE_CONCURRENCY = 32
+
+# A panel that fails this many probes in a row is skipped by get_server/validate_server_id for the cooldown
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30.0
+
 class PteroControl:
     def __init__(self, panels: List[Union[Dict[str, str], Panel]]):
         """
@@ -46,29 +56,88 @@ class PteroControl:
         
         self.client_sessions: Dict[str, httpx.AsyncClient] = {}
         self.app_apis: Dict[str, ApplicationAPI] = {}
+        # Everything a ClientServer needs from its panel, resolved once: (session, base_url, games_domain, app_api)
+        self._client_panels: Dict[str, Tuple[httpx.AsyncClient, str, Optional[str], ApplicationAPI]] = {}
+        # Client API URLs of each panel, built once from the normalized base_url: (server list URL, single server URL prefix)
+        self._client_urls: Dict[str, Tuple[str, str]] = {}
+        # One connection pool per origin, shared by the Client and App sessions that talk to it
+        self._transports: Dict[str, httpx.AsyncHTTPTransport] = {}
 
         for panel_id, config in self.panels_config.items():
             base_url = config.base_url.rstrip('/')
+            transport = self._get_transport(base_url)
             
             # Setup Client
             client_key = config.client_key
             if client_key:
-                headers = {'Accept': 'application/json','Content-Type':'application/json','Authorization': f'Bearer {client_key}'}
-                self.client_sessions[panel_id] = httpx.AsyncClient(headers=headers, event_hooks={'response': [self._check_rate_limit]}, timeout=30.0)
+                headers = auth_headers(client_key)
+                self.client_sessions[panel_id] = httpx.AsyncClient(headers=headers, event_hooks={'response': [self._check_rate_limit]},
+                                                                   transport=transport, timeout=30.0)
             
             # Setup App
             app_key = config.app_key
             if app_key:
-                app_headers = {'Accept': 'application/json','Content-Type':'application/json','Authorization': f'Bearer {app_key}'}
-                app_session = httpx.AsyncClient(headers=app_headers, event_hooks={'response': [self._check_rate_limit]}, timeout=30.0)
+                app_headers = auth_headers(app_key)
+                app_session = httpx.AsyncClient(headers=app_headers, event_hooks={'response': [self._check_rate_limit]},
+                                                transport=transport, timeout=30.0)
                 self.app_apis[config.id] = ApplicationAPI(app_session, base_url, config.id)
             else:
                 self.app_apis[config.id] = ApplicationAPI(None, base_url, config.id)
+            
+            if client_key:
+                self._client_panels[panel_id] = (self.client_sessions[panel_id], base_url, config.games_domain, self.app_apis[config.id])
+                self._client_urls[panel_id] = (f"{base_url}/client", f"{base_url}/client/servers/")
     
         # Internal cache for API integration
-        self._node_cache: Dict[Tuple[str, int], Node] = {} # Key: (panel_id, node_id)
-        self._app_server_cache: Dict[str, Tuple[str, dict]] = {} # Key: uuid, Value: (panel_id, server_dict)
+        # Node ids and UUIDs are only unique within a panel, so both caches are indexed by panel first
+        self._node_cache: Dict[str, Dict[int, Node]] = {panel_id: {} for panel_id in self.app_apis} # Key: panel_id, then node_id
+        self._app_server_cache: Dict[str, Dict[str, Tuple[dict, Optional[User]]]] = {panel_id: {} for panel_id in self.app_apis} # Key: panel_id, then uuid; Value: (app attributes, owner)
+        self._server_panel: Dict[str, str] = {} # Key: identifier or uuid, Value: panel_id
         self._last_app_cache_refresh = 0.0
+        self._app_cache_ttl = 300.0 # Seconds before a cache hit triggers a background refresh
+        self._node_cache_refreshed: Dict[str, float] = {} # Key: panel_id, Value: time of its last node listing
+        self._cache_miss_refresh_interval = 30.0 # Minimum age before an unknown server triggers one
+        
+        # Circuit breaker state of the single-server probes
+        self._panel_failures: Dict[str, int] = {} # Key: panel_id, Value: consecutive failed probes
+        self._panel_open_until: Dict[str, float] = {} # Key: panel_id, Value: time.monotonic() the panel is skipped until
+        self._refresh_inflight: Optional[asyncio.Future] = None # The app cache refresh currently running, shared by all callers
+        
+        # Start filling the app caches right away when constructed inside a running loop;
+        # otherwise the first call that needs them (or warmup()) fills them
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            if any(app.enabled for app in self.app_apis.values()):
+                self._schedule_cache_refresh()
+
+    def _get_transport(self, base_url: str) -> httpx.AsyncHTTPTransport:
+        """Returns the pooled HTTP/2 transport for the origin (scheme, host and port) of base_url."""
+        url = httpx.URL(base_url)
+        origin = f"{url.scheme}://{url.host}:{url.port or ''}"
+        transport = self._transports.get(origin)
+        if transport is None:
+            transport = self._transports[origin] = httpx.AsyncHTTPTransport(http2=True, limits=POOL_LIMITS)
+        return transport
+
+    def _panel_available(self, panel_id: str) -> bool:
+        """Whether probes may be sent to the panel, i.e. its circuit breaker isn't open."""
+        return time.monotonic() >= self._panel_open_until.get(panel_id, 0.0)
+
+    def _record_probe(self, panel_id: str, ok: bool):
+        """Records a probe outcome; trips the panel's breaker after _BREAKER_THRESHOLD failures in a row."""
+        if ok:
+            self._panel_failures.pop(panel_id, None)
+            return
+        
+        failures = self._panel_failures.get(panel_id, 0) + 1
+        self._panel_failures[panel_id] = failures
+        if failures >= _BREAKER_THRESHOLD:
+            if self._panel_available(panel_id):
+                logger.warning(f"Panel {panel_id} failed {failures} requests in a row, skipping it for {_BREAKER_COOLDOWN:.0f}s.")
+            self._panel_open_until[panel_id] = time.monotonic() + _BREAKER_COOLDOWN
 
     async def _check_rate_limit(self, response: httpx.Response):
         """Logs a warning if a rate limit is hit."""
@@ -77,68 +146,141 @@ class PteroControl:
 
 
     async def _refresh_app_caches(self, force: bool = False):
-        """Refreshes the internal node and app-server caches from all panels."""
+        """
+        Refreshes the internal node and app-server caches from all panels.
+
+        Concurrent callers share the refresh already in flight instead of each starting their own.
+        """
         if not self.app_apis:
             return # App API is not configured on any panel
 
-        now = asyncio.get_event_loop().time()
-        # Cache for 5 minutes (300 seconds)
-        if not force and (now - self._last_app_cache_refresh < 300):
+        if self._refresh_inflight is None and not force and (time.monotonic() - self._last_app_cache_refresh < self._app_cache_ttl):
             return
+        
+        # Shielded so that a cancelled caller does not cancel the refresh the others are waiting on
+        await asyncio.shield(self._schedule_cache_refresh())
+
+    def _schedule_cache_refresh(self) -> asyncio.Future:
+        """Starts a refresh of the app caches in the background, unless one is already running, and returns it."""
+        if self._refresh_inflight is None:
+            self._refresh_inflight = asyncio.ensure_future(self._load_app_caches(time.monotonic()))
+            self._refresh_inflight.add_done_callback(self._on_refresh_done)
+        return self._refresh_inflight
 
+    def _on_refresh_done(self, future: asyncio.Future):
+        if self._refresh_inflight is future:
+            self._refresh_inflight = None
+        if not future.cancelled() and future.exception():
+            logger.error(f"Refresh of the Application API caches failed: {future.exception()}")
+
+    async def _load_app_caches(self, now: float):
         logger.debug("Refreshing Application API caches (Nodes and Servers) from all panels...")
-        tasks = []
         node_params = {'include': 'location,allocations'}
         server_params = {'include': 'user,node'}
+        apps = [app for app in self.app_apis.values() if app.enabled]
         
-        for panel_id, app in self.app_apis.items():
-            tasks.append(app.get_nodes(params=node_params))
-            tasks.append(app.get_servers(params=server_params))
-
-        results = await asyncio.gather(*tasks)
+        # Servers are listed on every refresh. Nodes (with their allocations, which change whenever servers do)
+        # are listed once their listing is _app_cache_ttl old, or below when a server runs on an unknown node,
+        # so the early refreshes triggered by cache misses don't list them again.
+        stale_apps = [app for app in apps if not self._node_cache_fresh(app.panel_id, now)]
+        server_lists, node_lists = await asyncio.gather(
+            asyncio.gather(*(app.get_servers(params=server_params) for app in apps)),
+            asyncio.gather(*(app.get_nodes(params=node_params) for app in stale_apps)),
+        )
+        nodes_by_panel: Dict[str, List[Node]] = {app.panel_id: nodes for app, nodes in zip(stale_apps, node_lists)}
         
-        new_node_cache = {}
-        new_server_cache = {}
+        unknown_node_apps = [app for app, servers in zip(apps, server_lists) if app.panel_id not in nodes_by_panel and any(
+            srv['attributes']['node'] not in self._node_cache[app.panel_id] for srv in servers)]
+        if unknown_node_apps:
+            node_lists = await asyncio.gather(*(app.get_nodes(params=node_params) for app in unknown_node_apps))
+            nodes_by_panel.update((app.panel_id, nodes) for app, nodes in zip(unknown_node_apps, node_lists))
         
-        app_api_list = list(self.app_apis.values())
+        # Update the caches in place and only drop entries that disappeared,
+        # instead of building a second copy of both dicts on every refresh
+        seen_ids = set()
         
-        for i, app in enumerate(app_api_list):
-            panel_id = app.panel_id
-            all_nodes: List[Node] = results[i*2]
-            all_app_servers: List[dict] = results[i*2 + 1]
-            
+        for panel_id, all_nodes in nodes_by_panel.items():
+            node_cache = self._node_cache[panel_id]
+            seen_nodes = set()
             for node in all_nodes:
-                new_node_cache[(panel_id, node.id)] = node
+                node_cache[node.id] = node
+                seen_nodes.add(node.id)
+            for node_id in node_cache.keys() - seen_nodes:
+                del node_cache[node_id]
+            self._node_cache_refreshed[panel_id] = now
+        
+        for app, all_app_servers in zip(apps, server_lists):
+            panel_id = app.panel_id
+            server_cache = self._app_server_cache[panel_id]
+            seen_servers = set()
             for srv in all_app_servers:
-                new_server_cache[srv['attributes']['uuid']] = (panel_id, srv)
+                uuid = srv['attributes']['uuid']
+                # The owner is built once here and shared by every ClientServer made from this entry
+                user_data = srv.get("relationships", {}).get("user", {}).get("data")
+                server_cache[uuid] = (srv['attributes'], User(user_data, api=app, panel_id=panel_id) if user_data else None)
+                seen_servers.add(uuid)
+                for srv_id in (uuid, srv['attributes'].get('identifier')):
+                    if srv_id:
+                        self._server_panel[srv_id] = panel_id
+                        seen_ids.add(srv_id)
+            for uuid in server_cache.keys() - seen_servers:
+                del server_cache[uuid]
 
-        self._node_cache = new_node_cache
-        self._app_server_cache = new_server_cache
+        for srv_id in self._server_panel.keys() - seen_ids:
+            del self._server_panel[srv_id]
         self._last_app_cache_refresh = now
-        logger.debug(f"Refreshed caches: {len(self._node_cache)} nodes, {len(self._app_server_cache)} app servers across {len(self.app_apis)} panels.")
+        logger.debug(f"Refreshed caches: {sum(map(len, self._node_cache.values()))} nodes, {sum(map(len, self._app_server_cache.values()))} app servers across {len(self.app_apis)} panels.")
+
+    async def warmup(self):
+        """
+        Fills the App API caches (nodes, servers and their owners) unless they are already fresh.
+
+        Called automatically in the background when PteroControl is created inside a running event loop,
+        awaiting it just waits for that refresh.
+        """
+        await self._refresh_app_caches()
+
+    def _node_cache_fresh(self, panel_id: str, now: float) -> bool:
+        refreshed = self._node_cache_refreshed.get(panel_id)
+        return refreshed is not None and now - refreshed < self._app_cache_ttl
+
+    async def _ensure_app_caches(self):
+        """
+        Makes the app caches available using stale-while-revalidate.
+
+        A cache that was never filled is awaited, since there is nothing to serve yet.
+        After that, an expired cache is served as-is while a background task refreshes it.
+        """
+        if not self._last_app_cache_refresh:
+            await asyncio.shield(self._schedule_cache_refresh())
+            return
+        
+        if time.monotonic() - self._last_app_cache_refresh >= self._app_cache_ttl:
+            self._schedule_cache_refresh()
+
+    def _on_app_cache_miss(self):
+        """Called when a server is unknown to the app cache; refreshes it in the background, at most every 30 seconds."""
+        if time.monotonic() - self._last_app_cache_refresh >= self._cache_miss_refresh_interval:
+            self._schedule_cache_refresh()
 
 
     # -----------------------------------------------------------------
     # Client API Methods
     # -----------------------------------------------------------------
 
-    async def get_servers(self, fast: bool = False) -> List[ClientServer]:
-        """Gets all servers accessible by all configured CLIENT API keys."""
-        if not self.client_sessions:
-            logger.warning("get_servers called but no Client API keys are configured.")
-            return []
-            
+    async def _fetch_client_servers(self, params: Optional[Dict[str, Any]] = None) -> List[Tuple[str, dict]]:
+        """Lists the servers of every CLIENT API panel (GET /client), as (panel_id, server_data) pairs."""
         async def fetch_panel(panel_id: str, session: httpx.AsyncClient, url: str) -> Tuple[str, httpx.Response]:
             try:
-                resp = await session.get(url)
+                resp = await session.get(url, params=params)
                 return panel_id, resp
             except httpx.RequestError as e:
                 logger.error(f"Failed to get servers from panel {panel_id} ({url}): {e}")
-                return panel_id, httpx.Response(500, request=httpx.Request("GET", url), text=str(e))
+                return panel_id, failed_response("GET", url, str(e))
 
         tasks = []
         for panel_id, session in self.client_sessions.items():
-            url = f"{self.panels_config[panel_id].base_url}/client"
+            url = self._client_urls[panel_id][0]
             tasks.append(fetch_panel(panel_id, session, url))
         
         responses = await asyncio.gather(*tasks)
@@ -146,40 +288,53 @@ class PteroControl:
         server_data_list: List[Tuple[str, dict]] = []
         for panel_id, resp in responses:
             if resp.status_code == 200:
-                for srv_data in resp.json().get("data", []):
+                for srv_data in loads(resp.content).get("data", []):
                     server_data_list.append((panel_id, srv_data))
             else:
                 logger.error(f"An error occurred while getting servers from panel {panel_id} ({resp.url}):\n{resp.text}")
 
+        return server_data_list
+
+    async def get_servers(self, fast: bool = False) -> List[ClientServer]:
+        """Gets all servers accessible by all configured CLIENT API keys."""
+        if not self.client_sessions:
+            logger.warning("get_servers called but no Client API keys are configured.")
+            return []
+        
+        server_data_list = await self._fetch_with_app_caches(self._fetch_client_servers(), not fast)
         if not server_data_list:
             return []
+        
+        return await self._build_servers(server_data_list, fast)
+
+    async def _fetch_with_app_caches(self, fetch: Awaitable[T], ensure_caches: bool = True) -> T:
+        """Awaits a Client API fetch while the app caches are ensured alongside it, instead of after it."""
+        if not (self.app_apis and ensure_caches):
+            return await fetch
+        
+        result, _ = await asyncio.gather(fetch, self._ensure_app_caches())
+        return result
 
-        # Refresh App API cache if needed for integration
-        if self.app_apis and not fast:
-            await self._refresh_app_caches()
+    async def _build_servers(self, server_data_list: List[Tuple[str, dict]], fast: bool = False) -> List[ClientServer]:
+        """Builds ClientServer objects from (panel_id, server_data) pairs, merging in the App API caches (ensured by the caller)."""
 
         servers = []
         tasks = []
         for panel_id, server_data in server_data_list:
+            client_session, base_url, games_domain, app_api = self._client_panels[panel_id]
             node_id = server_data['attributes']['node']
             uuid = server_data['attributes']['uuid']
             
             # Find matching app data
-            node_obj = self._node_cache.get((panel_id, node_id))
-            cached_panel_id, server_app_full_obj = self._app_server_cache.get(uuid, (None, None))
+            node_obj = self._node_cache[panel_id].get(node_id)
+            cached = self._app_server_cache[panel_id].get(uuid)
             
             server_app_data = None
             user_obj = None
-            if server_app_full_obj and cached_panel_id == panel_id: # Ensure app data is from the same panel
-                server_app_data = server_app_full_obj['attributes']
-                user_data = server_app_full_obj.get("relationships", {}).get("user", {}).get("data")
-                if user_data:
-                    user_obj = User(user_data, api=self.app_apis.get(panel_id), panel_id=panel_id)
-            
-            app_api = self.app_apis.get(panel_id)
-            client_session = self.client_sessions[panel_id]
-            base_url = self.panels_config[panel_id].base_url
-            games_domain = self.panels_config[panel_id].games_domain
+            if cached:
+                server_app_data, user_obj = cached
+            elif not fast and app_api.enabled:
+                self._on_app_cache_miss()
 
             if fast:
                 server_obj = ClientServer(server_data, panel_id, client_session, base_url, games_domain,
@@ -190,13 +345,17 @@ class PteroControl:
                                                    app_api, node_obj, server_app_data, user_obj))
         
         if not fast:
-            results = await asyncio.gather(*tasks)
+            results = await run_all(limit_concurrency(tasks, _HYDRATE_CONCURRENCY))
             servers = [s for s in results if s]
 
         return servers
         
-    async def get_server(self, id: str) -> Optional[ClientServer]:
-        """Gets a single server by ID from any configured CLIENT API panel."""
+    async def get_server(self, id: str, _caches_warm: bool = False) -> Optional[ClientServer]:
+        """
+        Gets a single server by ID from any configured CLIENT API panel.
+
+        `_caches_warm` is internal: callers that already ensured the app caches skip doing it again.
+        """
         if not self.client_sessions:
             logger.warning("get_server called but no Client API keys are configured.")
             return None
@@ -204,31 +363,48 @@ class PteroControl:
         async def fetch_panel(panel_id: str, session: httpx.AsyncClient, url: str) -> Tuple[str, httpx.Response]:
             try:
                 resp = await session.get(url, timeout=3)
-                return panel_id, resp
             except httpx.RequestError as e:
-                return panel_id, httpx.Response(500, request=httpx.Request("GET", url), text=str(e))
+                self._record_probe(panel_id, False)
+                return panel_id, failed_response("GET", url, str(e))
+            self._record_probe(panel_id, resp.status_code < 500)
+            return panel_id, resp
         
-        tasks = []
-        for panel_id, session in self.client_sessions.items():
-            url = f"{self.panels_config[panel_id].base_url}/client/servers/{id}"
-            tasks.append(fetch_panel(panel_id, session, url))
-            
-        results = await asyncio.gather(*tasks)
+        skipped: List[str] = [] # Panels left out because their circuit breaker is open
         
-        found_panel_id = None
-        response = None
+        async def probe(panel_ids: List[str]) -> Tuple[Optional[str], Optional[httpx.Response]]:
+            tasks = []
+            for panel_id in panel_ids:
+                if not self._panel_available(panel_id):
+                    skipped.append(panel_id)
+                    continue
+                url = self._client_urls[panel_id][1] + id
+                tasks.append(fetch_panel(panel_id, self.client_sessions[panel_id], url))
+            
+            for panel_id, resp in await asyncio.gather(*tasks):
+                if resp.status_code == 200:
+                    return panel_id, resp
+            return None, None
         
-        for panel_id, resp in results:
-            if resp.status_code == 200:
-                found_panel_id = panel_id
-                response = resp
-                break
+        # Ask the panel the app cache says owns the server first, and only probe the rest if that fails
+        owner = self._server_panel.get(id)
+        found_panel_id, response = None, None
+        if owner in self.client_sessions:
+            found_panel_id, response = await probe([owner])
+        if not response:
+            found_panel_id, response = await probe([panel_id for panel_id in self.client_sessions if panel_id != owner])
         
         if not response or not found_panel_id:
+            if len(skipped) == len(self.client_sessions):
+                logger.error(f"Could not look up server {id}: every panel is skipped (circuit breaker open after repeated failures).")
+                return None
+            if skipped:
+                logger.error(f"An error occurred while getting server {id}. It was not found on the panels that were asked; "
+                             f"skipped {', '.join(skipped)} (circuit breaker open after repeated failures).")
+                return None
             logger.error(f"An error occurred while getting server {id}. It was not found on any panel.")
             return None
         
-        server_data = response.json()
+        server_data = loads(response.content)
 
         # --- API Integration ---
         node_obj = None
@@ -237,30 +413,33 @@ class PteroControl:
         app_api = self.app_apis.get(found_panel_id)
         
         if app_api:
-            await self._refresh_app_caches() # Ensure caches are warm
+            if not _caches_warm:
+                await self._ensure_app_caches()
             node_id = server_data['attributes']['node']
             uuid = server_data['attributes']['uuid']
-            node_obj = self._node_cache.get((found_panel_id, node_id))
+            node_obj = self._node_cache[found_panel_id].get(node_id)
             
-            cached_panel_id, server_app_full_obj = self._app_server_cache.get(uuid, (None, None))
-            if server_app_full_obj and cached_panel_id == found_panel_id:
-                server_app_data = server_app_full_obj['attributes']
-                user_data = server_app_full_obj.get("relationships", {}).get("user", {}).get("data")
-                if user_data:
-                    user_obj = User(user_data, api=app_api, panel_id=found_panel_id)
+            cached = self._app_server_cache[found_panel_id].get(uuid)
+            if cached:
+                server_app_data, user_obj = cached
+            elif app_api.enabled:
+                self._on_app_cache_miss()
         # --- End Integration ---
 
-        client_session = self.client_sessions[found_panel_id]
-        base_url = self.panels_config[found_panel_id].base_url
-        games_domain = self.panels_config[found_panel_id].games_domain
+        client_session, base_url, games_domain, _ = self._client_panels[found_panel_id]
         
         server = await ClientServer.with_data(server_data, found_panel_id, client_session, base_url, games_domain,
                                             app_api, node_obj, server_app_data, user_obj)
         
-        if not server.resources and not server.is_installing: 
-            logger.error(f"An error occurred while getting server object {id} (missing resources) {response.json()}")
-            return None
-        return server
+        return server if self._is_hydrated(server, id) else None
+
+    @staticmethod
+    def _is_hydrated(server: ClientServer, id: str) -> bool:
+        """Whether a fully-initialized server got its resources (installing servers have none); logs the ones that didn't."""
+        if not server.resources and not server.is_installing:
+            logger.error(f"An error occurred while getting server object {id} (missing resources) {server.data}")
+            return False
+        return True
     
     async def validate_server_id(self, srv_id: str) -> bool:
         """Validates a server ID exists on any configured CLIENT API panel."""
@@ -271,42 +450,95 @@ class PteroControl:
         async def fetch_panel(panel_id: str, session: httpx.AsyncClient, url: str) -> bool:
             try:
                 resp = await session.get(url, timeout=3)
-                if resp.status_code == 200:
-                    logger.debug(f"the server_id {srv_id} is valid on panel {panel_id}")
-                    return True
             except httpx.RequestError as e:
+                self._record_probe(panel_id, False)
                 logger.error(f"Error validating server ID {srv_id} on panel {panel_id}: {e}")
+                return False
+            self._record_probe(panel_id, resp.status_code < 500)
+            if resp.status_code == 200:
+                logger.debug(f"the server_id {srv_id} is valid on panel {panel_id}")
+                return True
             return False
 
         tasks = []
+        skipped: List[str] = [] # Panels left out because their circuit breaker is open
         for panel_id, session in self.client_sessions.items():
-            url = f"{self.panels_config[panel_id].base_url}/client/servers/{srv_id}"
+            if not self._panel_available(panel_id):
+                skipped.append(panel_id)
+                continue
+            url = self._client_urls[panel_id][1] + srv_id
             tasks.append(fetch_panel(panel_id, session, url))
         
-        results = await asyncio.gather(*tasks)
-        
-        if any(results):
-            return True
+        # Return on the first panel that knows the server and cancel the probes still running
+        pending = {asyncio.ensure_future(task) for task in tasks}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.result() for task in done):
+                    return True
+        finally:
+            for task in pending:
+                task.cancel()
 
+        if skipped:
+            logger.warning(f"the server_id {srv_id} could not be validated on {', '.join(skipped)} (circuit breaker open after repeated failures)")
+            return False
         logger.debug(f"the server_id {srv_id} is invalid on all panels")
         return False
     
-    async def get_servers_from_list(self, srv_ids: list[str]) -> List[ClientServer]:
-        """Gets multiple servers by ID from any configured CLIENT API panel."""
+    async def get_servers_from_list(self, srv_ids: List[str], per_page: int = 100) -> List[ClientServer]:
+        """
+        Gets multiple servers by ID (identifier or UUID) from any configured CLIENT API panel.
+
+        The server listing of every panel is fetched once and filtered, instead of looking up each ID on its own.
+        IDs missing from the listings (e.g. servers only visible to an admin key, or past the first page) fall back to get_server.
+        """
         if not self.client_sessions:
             logger.warning("get_servers_from_list called but no Client API keys are configured.")
             return []
-            
-        tasks = [self.get_server(srv_id) for srv_id in srv_ids]
-        results = await asyncio.gather(*tasks)
-        return [srv for srv in results if srv]
+        if not srv_ids:
+            return []
+        
+        wanted = set(srv_ids)
+        matches: Dict[str, Tuple[str, dict]] = {}
+        for panel_id, server_data in await self._fetch_with_app_caches(self._fetch_client_servers({'per_page': per_page})):
+            attrs = server_data['attributes']
+            for key in (attrs['identifier'], attrs['uuid']):
+                if key in wanted and key not in matches:
+                    matches[key] = (panel_id, server_data)
+        
+        unique_ids = list(dict.fromkeys(srv_ids))
+        found_ids = [srv_id for srv_id in unique_ids if srv_id in matches]
+        missing_ids = [srv_id for srv_id in unique_ids if srv_id not in matches]
+        
+        # Each matched server is built once, even when requested by both identifier and UUID
+        to_build = list({(panel_id, data['attributes']['identifier']): (panel_id, data) for panel_id, data in map(matches.get, found_ids)}.values())
+        built = {(srv.panel_id, srv.identifier): srv for srv in await self._build_servers(to_build)} if to_build else {}
+        
+        by_id: Dict[str, ClientServer] = {}
+        for srv_id in found_ids:
+            panel_id, data = matches[srv_id]
+            srv = built.get((panel_id, data['attributes']['identifier']))
+            if srv and self._is_hydrated(srv, srv_id):
+                by_id[srv_id] = srv
+        
+        if missing_ids:
+            results = await run_all(self.get_server(srv_id, _caches_warm=True) for srv_id in missing_ids)
+            for srv_id, srv in zip(missing_ids, results):
+                if srv:
+                    by_id[srv_id] = srv
+        
+        return [by_id[srv_id] for srv_id in srv_ids if srv_id in by_id]
 
     async def close(self):
         """Closes all httpx sessions."""
+        if self._refresh_inflight and not self._refresh_inflight.done():
+            self._refresh_inflight.cancel()
+        
         tasks = []
         for session in self.client_sessions.values():
             tasks.append(session.aclose())
         for app in self.app_apis.values():
-            tasks.append(app.app_session.aclose())
+            tasks.append(app.aclose())
         
         await asyncio.gather(*tasks)
\ No newline at end of file
@@ -154,6 +154,8 @@ class Subuser:
 
 class NodeAllocation:
     """Represents an Allocation from the Application API (Node endpoint)."""
+    __slots__ = ("data", "id", "ip", "ip_alias", "port", "server_id")
+
     def __init__(self, alloc_data: dict):
         self.data: dict = alloc_data["attributes"]
         self.id: int = self.data["id"]
@@ -165,6 +167,8 @@ class NodeAllocation:
 
 class Location:
     """Represents a Location from the Application API."""
+    __slots__ = ("api", "panel_id", "data", "id", "short_code", "description", "created_at", "updated_at", "nodes")
+
     def __init__(self, loc_data: dict, api: Optional['ApplicationAPI'] = None, panel_id: Optional[str] = None):
         self.api = api
         self.panel_id = panel_id
@@ -188,6 +192,8 @@ class Location:
 
 class Node:
     """Represents a Node from the Application API."""
+    __slots__ = ("api", "panel_id", "data", "id", "uuid", "public", "name", "description", "location_id", "fqdn", "scheme", "behind_proxy", "maintenance_mode", "memory", "memory_overallocate", "disk", "disk_overallocate", "upload_size", "daemon_listen", "daemon_sftp", "daemon_base", "allocations", "location")
+
     def __init__(self, node_data: dict, api: Optional['ApplicationAPI'] = None, panel_id: Optional[str] = None):
         self.api = api
         self.panel_id = panel_id
@@ -227,6 +233,8 @@ class Node:
 
 class User:
     """Represents a User from the Application API."""
+    __slots__ = ("api", "panel_id", "data", "id", "external_id", "uuid", "username", "email", "first_name", "last_name", "language", "root_admin", "two_factor", "created_at", "updated_at", "server_ids")
+
     def __init__(self, user_data: dict, api: Optional['ApplicationAPI'] = None, panel_id: Optional[str] = None):
         self.api = api
         self.panel_id = panel_id
@@ -252,6 +260,8 @@ class User:
 
 class Nest:
     """Represents a Nest from the Application API."""
+    __slots__ = ("api", "panel_id", "data", "id", "uuid", "author", "name", "description", "created_at", "updated_at", "eggs")
+
     def __init__(self, nest_data: dict, api: Optional['ApplicationAPI'] = None, panel_id: Optional[str] = None):
         self.api = api
         self.panel_id = panel_id
@@ -277,6 +287,8 @@ class Nest:
 
 class Egg:
     """Represents an Egg from the Application API."""
+    __slots__ = ("api", "panel_id", "data", "id", "uuid", "nest_id", "author", "name", "description", "docker_image", "startup", "created_at", "updated_at", "nest")
+
     def __init__(self, egg_data: dict, api: Optional['ApplicationAPI'] = None, panel_id: Optional[str] = None):
         self.api = api
         self.panel_id = panel_id
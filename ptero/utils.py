@@ -0,0 +1,72 @@
+"""
+Ptero-Wrapper Utils
+Contains small internal helpers shared by the wrapper's modules.
+"""
+
+import httpx, asyncio, json
+from typing import Any, Awaitable, Dict, Iterable, List
+
+try:
+    import orjson
+except ImportError: # orjson is an optional speedup, see the 'speedups' extra
+    orjson = None
+
+# Parses a JSON document from bytes. Both parsers take the raw response body,
+# which skips httpx's charset detection in resp.json().
+loads = orjson.loads if orjson is not None else json.loads
+
+# Connection pool of every session the wrapper builds (PteroControl's per-origin transports and
+# ApplicationAPI.create()); HTTP/2 multiplexes the concurrent fan-outs onto few connections
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=256, keepalive_expiry=60.0)
+
+# Headers sent on every panel request; only the bearer token differs between sessions
+BASE_HEADERS = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+
+def auth_headers(api_key: str) -> Dict[str, str]:
+    """Returns the session headers for an API key."""
+    return {**BASE_HEADERS, 'Authorization': f'Bearer {api_key}'}
+
+def encode_json_body(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Replaces a `json=` request argument with an orjson-encoded `content=` body when orjson is installed."""
+    if orjson is not None and kwargs.get('json') is not None:
+        # OPT_NON_STR_KEYS keeps stdlib behaviour for int dict keys
+        kwargs['content'] = orjson.dumps(kwargs.pop('json'), option=orjson.OPT_NON_STR_KEYS)
+        kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Content-Type': 'application/json'}
+    return kwargs
+
+def failed_response(method: str, url: str, text: str, status_code: int = 500) -> httpx.Response:
+    """Builds the synthetic response the wrapper returns when a request couldn't be made (or failed locally)."""
+    return httpx.Response(status_code=status_code, request=httpx.Request(method, url), text=text)
+
+def limit_concurrency(aws: Iterable[Awaitable[Any]], limit: int) -> List[Awaitable[Any]]:
+    """Wraps `aws` so that at most `limit` of them run at once, whichever way they are awaited."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return [run(aw) for aw in aws]
+
+async def gather_bounded(aws: Iterable[Awaitable[Any]], limit: int) -> List[Any]:
+    """Awaits `aws` concurrently, with at most `limit` running at once, and returns their results in order."""
+    return await asyncio.gather(*limit_concurrency(aws, limit))
+
+async def run_all(aws: Iterable[Awaitable[Any]]) -> List[Any]:
+    """
+    Awaits `aws` concurrently and returns their results in order, like asyncio.gather.
+
+    Schedules every awaitable up front and then awaits them one by one, which skips gather's
+    per-child callback bookkeeping on large fan-outs. Unlike gather, if one raises the rest are
+    cancelled, so only use it where abandoning the siblings is fine.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return [await task for task in tasks]
+    except BaseException:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception() # Mark finished failures as retrieved, we only re-raise the first
+        raise